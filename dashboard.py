@@ -4,10 +4,14 @@
 import json
 import re
 import subprocess
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
 
+from rich.console import Group
 from rich.table import Table
 from rich.text import Text
 
@@ -16,6 +20,7 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
 from textual.widgets import Footer, Input, RichLog, Static, TabbedContent, TabPane
+from textual.worker import get_current_worker
 
 # ─── Paths ────────────────────────────────────────────────────────────────────
 CLAUDE_DIR = Path.home() / ".claude"
@@ -48,6 +53,21 @@ EVENT_STYLES = {
     "💬": "bold #5fd7d7",
 }
 
+# Tab ids as bits, so per-keystroke guards test an int instead of
+# comparing strings
+_LIVE_TAB_MASK = 1 << 0
+_STATS_TAB_MASK = 1 << 1
+_INSTANCES_TAB_MASK = 1 << 2
+_TAB_MASKS = {
+    "tab-live": _LIVE_TAB_MASK,
+    "tab-stats": _STATS_TAB_MASK,
+    "tab-instances": _INSTANCES_TAB_MASK,
+}
+
+# Line retention for the event log widget — lines past this are dropped,
+# so rebuilds never need to format more than this many entries
+MAX_LOG_LINES = 5000
+
 # Stable color palette for project names
 PROJECT_COLORS = [
     "#5fafff", "#af87ff", "#ff87d7", "#5fd7d7", "#d7af5f",
@@ -151,24 +171,36 @@ EMOJI_COUNT_MAP = {
 # "📋 Task created" needs a substring match, not just emoji presence
 _TASK_CREATED_MARKER = "📋 Task created"
 
+# All count markers folded into one alternation so counting is a single
+# C-level scan over the buffer instead of N×19 Python substring tests.
+_EVENT_COUNT_RE = re.compile("|".join(re.escape(e) for e in EMOJI_COUNT_MAP))
+
 
 def count_events(lines: list[str]) -> dict:
     """Count events by emoji from log lines."""
     counts = {key: 0 for key in EMOJI_COUNT_MAP.values()}
     counts["tasks"] = 0
-    for line in lines:
-        clean = strip_ansi(line)
-        for emoji, key in EMOJI_COUNT_MAP.items():
-            if emoji in clean:
-                counts[key] += 1
-        if _TASK_CREATED_MARKER in clean:
+    findall = _EVENT_COUNT_RE.findall
+    for line in strip_ansi("\n".join(lines)).split("\n"):
+        # Each emoji counts at most once per line, so a repeated marker in
+        # a message body doesn't inflate the tally
+        for emoji in set(findall(line)):
+            counts[EMOJI_COUNT_MAP[emoji]] += 1
+        if _TASK_CREATED_MARKER in line:
             counts["tasks"] += 1
     return counts
 
 
 # ─── Log entry ────────────────────────────────────────────────────────────────
 
-@dataclass
+# Entry kinds, classified once at parse so the counting loops compare
+# integers instead of substring-searching every event string per refresh
+_KIND_OTHER = 0
+_KIND_SESSION_START = 1
+_KIND_FINISHED = 2
+
+
+@dataclass(slots=True)
 class LogEntry:
     """Parsed log line."""
     raw: str
@@ -178,9 +210,20 @@ class LogEntry:
     event: str = ""
     emoji: str = ""
     style: str = ""
-
-    def matches_filter(self, text_filter: str, project_filter: str, event_type_filter: str) -> bool:
-        if text_filter and text_filter.lower() not in self.raw.lower():
+    date_prefix: str = ""  # "MM/DD" from the timestamp, or "" if undated
+    color: str = ""  # project color, memoized on first render
+    display_event: str = ""  # event with Task→Todo + model-name normalization applied
+    kind: int = 0  # _KIND_OTHER / _KIND_SESSION_START / _KIND_FINISHED
+    fp: int = 0  # 64-bit Bloom fingerprint of lowercased 3-grams, see _bloom_fp
+    rendered: "Text | None" = None  # assembled display line, memoized on first render
+
+    def matches_filter(self, text_matcher, project_filter: str, event_type_filter: str, query_fp: int = 0) -> bool:
+        # Bloom gate: a line can only contain the query if it has every
+        # 3-gram bit — one AND+compare rejects most non-matches before the
+        # matcher ever scans the text
+        if query_fp and (self.fp & query_fp) != query_fp:
+            return False
+        if text_matcher is not None and not text_matcher(self.raw):
             return False
         if project_filter and self.project != project_filter:
             return False
@@ -191,6 +234,98 @@ class LogEntry:
         return True
 
 
+def _filter_entries(
+    entries: list["LogEntry"],
+    text_matcher,
+    project_filter: str,
+    event_type_filter: str,
+    query_fp: int,
+) -> list["LogEntry"]:
+    """Tight filter loop over the buffer with everything bound to locals.
+
+    Equivalent to calling matches_filter per entry, minus the method
+    dispatch and global lookups — this is the hottest loop on a filter
+    change. `text_matcher` is a _make_matcher predicate or None.
+    """
+    if not project_filter and not event_type_filter:
+        if text_matcher is None:
+            return list(entries)
+        if query_fp:
+            return [e for e in entries if (e.fp & query_fp) == query_fp and text_matcher(e.raw)]
+        return [e for e in entries if text_matcher(e.raw)]
+
+    emoji = EVENT_TYPE_MAP.get(event_type_filter, "") if event_type_filter else ""
+    out: list[LogEntry] = []
+    append = out.append
+    for e in entries:
+        if query_fp and (e.fp & query_fp) != query_fp:
+            continue
+        if text_matcher is not None and not text_matcher(e.raw):
+            continue
+        if project_filter and e.project != project_filter:
+            continue
+        if emoji and emoji not in e.event:
+            continue
+        append(e)
+    return out
+
+
+@lru_cache(maxsize=128)
+def _compile_filter(value: str) -> re.Pattern:
+    """Compiled case-insensitive literal matcher for a filter string.
+
+    The LRU survives filter-bar toggles, so re-entering a recent query
+    reuses its pattern.
+    """
+    return re.compile(re.escape(value), re.IGNORECASE)
+
+
+def _make_matcher(value: str):
+    """Build a specialized predicate for a filter query.
+
+    The whole query is one case-insensitive substring; the closure
+    default pins the compiled search to a local, so the per-line call
+    does no global lookups.
+    """
+    def match(raw: str, _search=_compile_filter(value).search) -> bool:
+        return _search(raw) is not None
+    return match
+
+
+def _dedupe_consecutive(entries: list) -> list[tuple]:
+    """Collapse runs of identical raw lines into (entry, count) pairs.
+
+    Burst spam (the same line logged back-to-back) renders as one row with
+    a (×N) suffix. Display-only: the buffer keeps every entry so counts
+    and stats stay exact.
+    """
+    out: list = []
+    prev_raw = None
+    for e in entries:
+        raw = e.raw if isinstance(e, LogEntry) else None
+        if raw is not None and raw == prev_raw:
+            out[-1] = (e, out[-1][1] + 1)
+        else:
+            out.append((e, 1))
+            prev_raw = raw
+    return out
+
+
+def _bloom_fp(s: str) -> int:
+    """64-bit Bloom fingerprint: one bit per lowercased 3-gram.
+
+    hash() is salted per process, but both entry and query fingerprints
+    are computed in the same process, so the bits line up.
+    """
+    s = s.lower()
+    fp = 0
+    for i in range(len(s) - 2):
+        fp |= 1 << (hash(s[i:i + 3]) & 63)
+    return fp
+
+
+_MODEL_ID_RE = re.compile(r"\[(claude-[^\]]+)\]")
+
 # All emojis to search for when identifying event type (EVENT_STYLES keys + extras)
 _ALL_EVENT_EMOJIS = list(EVENT_STYLES.keys()) + ["🔧", "📖", "🔍", "📋", "🟢", "🔴", "📐"]
 # Deduplicate while preserving order (EVENT_STYLES takes priority)
@@ -223,6 +358,38 @@ def parse_log_line(raw_line: str) -> LogEntry:
             emoji = e
             break
 
+    ts = timestamp.strip()
+    date_prefix = ""
+    if len(ts) >= 5 and ts[2] == "/" and ts[:2].isdigit() and ts[3:5].isdigit():
+        date_prefix = ts[:5]
+
+    # Intern the heavily-duplicated fields: across thousands of entries
+    # there are only a handful of distinct projects/branches/dates, and
+    # interning makes the per-entry equality checks pointer comparisons.
+    if project:
+        project = sys.intern(project)
+    if branch:
+        branch = sys.intern(branch)
+    if date_prefix:
+        date_prefix = sys.intern(date_prefix)
+
+    # Normalize display text once here — the event string is immutable,
+    # so doing it per render would repeat the same scans on every rebuild.
+    display_event = event
+    if "📋" in display_event:
+        display_event = display_event.replace("📋 Task created", "📋 Todo created").replace("📋 Task completed", "📋 Todo completed")
+    m = _MODEL_ID_RE.search(display_event)
+    if m:
+        # [claude-opus-4-6] → [Opus 4.6]
+        display_event = display_event.replace(m.group(0), f"[{format_model_name(m.group(1))}]")
+
+    if "🟢" in event and "Session started" in event:
+        kind = _KIND_SESSION_START
+    elif "🏁" in event:
+        kind = _KIND_FINISHED
+    else:
+        kind = _KIND_OTHER
+
     return LogEntry(
         raw=clean,
         timestamp=timestamp,
@@ -231,6 +398,10 @@ def parse_log_line(raw_line: str) -> LogEntry:
         event=event,
         emoji=emoji,
         style=style,
+        date_prefix=date_prefix,
+        display_event=display_event,
+        kind=kind,
+        fp=_bloom_fp(clean),
     )
 
 
@@ -241,6 +412,21 @@ class LogTailer:
         self.path = path
         self.offset = 0
         self._all_entries: list[LogEntry] = []
+        # Parallel date prefixes (monotone, log is chronological) + a
+        # per-project bucket view so filters slice instead of scan
+        self._date_prefixes: list[str] = []
+        self._by_project: dict[str, list[LogEntry]] = {}
+        self.revision = 0  # bumped on every append/truncate for cache keys
+        self.on_append = None  # optional per-entry observer hook
+
+    def _append(self, entry: LogEntry) -> None:
+        self._all_entries.append(entry)
+        self._date_prefixes.append(entry.date_prefix)
+        if entry.project:
+            self._by_project.setdefault(entry.project, []).append(entry)
+        self.revision += 1
+        if self.on_append is not None:
+            self.on_append(entry)
 
     def poll(self) -> list[LogEntry]:
         """Read new lines since last poll. Returns only new entries."""
@@ -251,6 +437,9 @@ class LogTailer:
             if size < self.offset:
                 self.offset = 0
                 self._all_entries.clear()
+                self._date_prefixes.clear()
+                self._by_project.clear()
+                self.revision += 1
             if size == self.offset:
                 return []
 
@@ -260,12 +449,14 @@ class LogTailer:
                 self.offset = f.tell()
 
             new_entries = []
-            for line in data.strip().splitlines():
+            # splitlines on the unstripped chunk — per-line strip below
+            # already drops blanks, so no full-buffer copy is needed
+            for line in data.splitlines():
                 line = line.strip()
                 if line:
                     entry = parse_log_line(line)
                     new_entries.append(entry)
-                    self._all_entries.append(entry)
+                    self._append(entry)
             return new_entries
         except Exception:
             return []
@@ -274,6 +465,34 @@ class LogTailer:
     def all_entries(self) -> list[LogEntry]:
         return self._all_entries
 
+    def entries_for_dates(self, dates: list[str]) -> list[LogEntry]:
+        """Entries matching the given date prefixes.
+
+        The log is appended in timestamp order, so a recent date range is
+        a suffix of the buffer: walk the parallel prefix list backward and
+        stop at the first dated entry outside the range. MM/DD prefixes
+        don't sort across a year boundary, so membership is the only
+        test; undated entries (malformed lines) are skipped, not treated
+        as a boundary.
+        """
+        if not dates:
+            return []
+        valid = set(dates)
+        prefixes = self._date_prefixes
+        start = 0
+        for i in range(len(prefixes) - 1, -1, -1):
+            p = prefixes[i]
+            if p and p not in valid:
+                start = i + 1
+                break
+        return [e for e in self._all_entries[start:] if e.date_prefix in valid]
+
+    def entries_for_project(self, project: str) -> list[LogEntry]:
+        return self._by_project.get(project, [])
+
+    def projects(self) -> list[str]:
+        return list(self._by_project)
+
     def load_existing(self):
         """Load entire file on startup."""
         if not self.path.exists():
@@ -281,14 +500,15 @@ class LogTailer:
         try:
             data = self.path.read_text(errors="replace")
             self.offset = len(data.encode("utf-8"))
-            for line in data.strip().splitlines():
+            for line in data.splitlines():
                 line = line.strip()
                 if line:
-                    self._all_entries.append(parse_log_line(line))
+                    self._append(parse_log_line(line))
         except Exception:
             pass
 
 
+@lru_cache(maxsize=256)
 def _normalize_project_key(name: str) -> str:
     """Normalize a project name for fuzzy matching (lowercase, no separators)."""
     return name.lower().replace("-", "").replace("_", "")
@@ -526,6 +746,16 @@ def _format_tokens(n: int) -> str:
 TIME_RANGE_LABELS = {"Today": "Today", "7d": "7 Days", "All": "All Time"}
 
 
+@lru_cache(maxsize=512)
+def _format_daily_date(date_str: str) -> str:
+    """Format YYYY-MM-DD as 'Mon MM/DD'. Cached — strptime is pure-Python slow."""
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d")
+        return dt.strftime("%a %m/%d")
+    except ValueError:
+        return date_str
+
+
 # ─── Time helpers ────────────────────────────────────────────────────────────
 
 def _parse_timestamp(ts: str) -> datetime | None:
@@ -556,7 +786,7 @@ def _time_diff_minutes(start: str, end: str) -> float:
 
 # ─── Agent tree data ────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class AgentNode:
     """An agent spawned within a session."""
     agent_type: str
@@ -566,9 +796,13 @@ class AgentNode:
     duration_minutes: float = 0.0
     is_running: bool = True
     children: list = field(default_factory=list)
+    # Render fields, filled once when the tree is finalized
+    short_type: str = ""
+    color: str = ""
+    running_children: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionNode:
     """A session with nested agents."""
     project: str
@@ -582,6 +816,15 @@ class SessionNode:
 BRAILLE_SPINNER = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
 
 
+def _finalize_agent(agent: AgentNode) -> None:
+    """Precompute render fields so per-frame rendering does no string work."""
+    agent.short_type = agent.agent_type[:14]
+    agent.color = "#2e8b57" if agent.short_type == "Plan" else "#5fd7d7"
+    agent.running_children = [c for c in agent.children if c.is_running]
+    for child in agent.children:
+        _finalize_agent(child)
+
+
 def build_agent_tree(entries: list[LogEntry]) -> list[SessionNode]:
     """Build agent tree from log entries using stack-based inference."""
     sessions: list[SessionNode] = []
@@ -589,7 +832,7 @@ def build_agent_tree(entries: list[LogEntry]) -> list[SessionNode]:
     agent_map: dict[str, AgentNode] = {}
 
     for entry in entries:
-        if "🟢" in entry.event and "Session started" in entry.event:
+        if entry.kind == _KIND_SESSION_START:
             if entry.project in current_sessions:
                 sessions.append(current_sessions[entry.project])
             model = ""
@@ -678,9 +921,47 @@ def build_agent_tree(entries: list[LogEntry]) -> list[SessionNode]:
                 if started and (now - started).total_seconds() > 600:
                     agent.is_running = False
 
+    # Freeze render fields after is_running has settled
+    for sess in sessions:
+        for agent in sess.agents:
+            _finalize_agent(agent)
+
     return sessions
 
 
+@dataclass(slots=True)
+class _StatsAgg:
+    """Single-pass aggregate over a set of log entries."""
+    sessions: int = 0
+    messages: int = 0
+    days_active: int = 0
+    today_sessions: int = 0
+    today_messages: int = 0
+
+
+def _aggregate_stats(entries: list[LogEntry], today_mmdd: str) -> _StatsAgg:
+    """Collect all stats-summary counters in one traversal of `entries`."""
+    agg = _StatsAgg()
+    dates_seen: set[str] = set()
+    for entry in entries:
+        kind = entry.kind
+        is_start = kind == _KIND_SESSION_START
+        is_done = kind == _KIND_FINISHED
+        if is_start:
+            agg.sessions += 1
+        if is_done:
+            agg.messages += 1
+        if entry.date_prefix:
+            dates_seen.add(entry.date_prefix)
+            if entry.date_prefix == today_mmdd:
+                if is_start:
+                    agg.today_sessions += 1
+                if is_done:
+                    agg.today_messages += 1
+    agg.days_active = len(dates_seen)
+    return agg
+
+
 def _build_active_session_map(sessions: list[SessionNode]) -> dict[str, SessionNode]:
     """Build a lookup from normalized project key to the active session."""
     return {
@@ -692,7 +973,7 @@ def _build_active_session_map(sessions: list[SessionNode]) -> dict[str, SessionN
 
 # ─── Process scanner ─────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInstance:
     """A running Claude process detected from the system."""
     pid: int
@@ -704,6 +985,8 @@ class ProcessInstance:
     cwd: str
     project_name: str
     is_active: bool  # CPU > 1%
+    project_name_lower: str = ""  # precomputed sort key — avoids .lower() per comparison
+    color: str = ""  # project color, memoized on first render
     claude_version: str = ""  # e.g. "2.1.39"
     mcp_server_count: int = 0  # npm→node child pairs
     has_shell: bool = False  # zsh/bash child = running a command
@@ -736,6 +1019,10 @@ def _format_uptime(etime: str) -> str:
 
 _PROJECT_NAME_CACHE: dict[str, str] = {}
 
+# Child-process classification — set membership instead of an if/elif chain
+_SHELL_NAMES = frozenset({"zsh", "bash", "sh", "/bin/zsh", "/bin/bash"})
+_VERSION_RE = re.compile(r"versions/(\d+\.\d+\.\d+)")
+
 
 def _derive_project_name(cwd: str) -> str:
     """Derive project name from CWD by finding nearest git root."""
@@ -768,12 +1055,19 @@ def _derive_project_name(cwd: str) -> str:
     return result
 
 
+def _instance_sort_key(inst: ProcessInstance) -> tuple:
+    """Sort key: active first, then CPU descending, then project name."""
+    return (not inst.is_active, -inst.cpu_percent, inst.project_name_lower)
+
+
 class ProcessScanner:
     """Scans running Claude processes from the system."""
 
     def __init__(self):
         self._instances: list[ProcessInstance] = []
         self.generation: int = 0
+        self._active_count: int = 0
+        self._total_mem_mb: float = 0.0
 
     def scan(self) -> list[ProcessInstance]:
         """Scan for running Claude processes using ps + lsof."""
@@ -803,6 +1097,8 @@ class ProcessScanner:
 
         if not pid_info:
             self._instances = []
+            self._active_count = 0
+            self._total_mem_mb = 0.0
             return self._instances
 
         # Batch CWD lookup
@@ -880,20 +1176,20 @@ class ProcessScanner:
             has_caffeinate = False
             shell_pids: list[int] = []
             for cpid, cname in children:
-                if cname == "<defunct>":
-                    continue
-                if "claude/versions/" in cname:
-                    # Extract version from path like .../versions/2.1.39/...
-                    m = re.search(r"versions/(\d+\.\d+\.\d+)", cname)
-                    if m:
-                        claude_version = m.group(1)
-                elif cname == "npm":
-                    mcp_count += 1
-                elif cname in ("zsh", "bash", "sh", "/bin/zsh", "/bin/bash"):
+                if cname in _SHELL_NAMES:
                     has_shell = True
                     shell_pids.append(cpid)
+                elif cname == "npm":
+                    mcp_count += 1
                 elif cname == "caffeinate":
                     has_caffeinate = True
+                elif cname == "<defunct>":
+                    continue
+                elif "claude/versions/" in cname:
+                    # Extract version from path like .../versions/2.1.39/...
+                    m = _VERSION_RE.search(cname)
+                    if m:
+                        claude_version = m.group(1)
 
             # Resolve actual command running inside the shell
             if has_shell and shell_pids:
@@ -910,11 +1206,10 @@ class ProcessScanner:
                         if full_args:
                             # Shorten all path-like args to basename
                             # e.g. "find /Users/x/Documents/github/proj" → "find proj"
-                            arg_parts = full_args.split()
-                            for i, part in enumerate(arg_parts):
-                                if "/" in part:
-                                    arg_parts[i] = part.rsplit("/", 1)[-1] or part
-                            shell_command = " ".join(arg_parts)
+                            shell_command = " ".join(
+                                (p.rsplit("/", 1)[-1] or p) if "/" in p else p
+                                for p in full_args.split()
+                            )
                             if len(shell_command) > 25:
                                 shell_command = shell_command[:22] + "..."
                         else:
@@ -933,6 +1228,7 @@ class ProcessScanner:
                 cwd=cwd,
                 project_name=project_name,
                 is_active=cpu > 1.0 or has_caffeinate,
+                project_name_lower=project_name.lower(),
                 claude_version=claude_version,
                 mcp_server_count=mcp_count,
                 has_shell=has_shell,
@@ -941,8 +1237,11 @@ class ProcessScanner:
             ))
 
         # Active first (by CPU desc), then idle (alphabetical)
-        instances.sort(key=lambda x: (-x.is_active, -x.cpu_percent, x.project_name.lower()))
+        instances.sort(key=_instance_sort_key)
         self._instances = instances
+        # Aggregate once per scan so the per-tick header update is O(1)
+        self._active_count = sum(1 for i in instances if i.is_active)
+        self._total_mem_mb = sum(i.mem_mb for i in instances)
         return instances
 
     @property
@@ -951,11 +1250,11 @@ class ProcessScanner:
 
     @property
     def active_count(self) -> int:
-        return sum(1 for i in self._instances if i.is_active)
+        return self._active_count
 
     @property
     def total_mem_mb(self) -> float:
-        return sum(i.mem_mb for i in self._instances)
+        return self._total_mem_mb
 
 
 # ─── Textual App ──────────────────────────────────────────────────────────────
@@ -1147,19 +1446,45 @@ class ClaudeDashboardApp(App):
     compact_mode: reactive[bool] = reactive(False, layout=False)
     live_tail: reactive[bool] = reactive(True, layout=False)
 
+    def watch_text_filter(self, value: str) -> None:
+        # Specialize the query into a predicate once per change — the
+        # per-line test then runs a compiled search bound to a local.
+        self._text_matcher = _make_matcher(value) if value else None
+        # Bloom gate only applies once the query has a full 3-gram
+        self._query_fp = _bloom_fp(value) if len(value) >= 3 else 0
+
     def __init__(self):
         super().__init__()
         self.tailer = LogTailer(LOG_FILE)
+        self.tailer.on_append = self._observe_entry
         self.scanner = ProcessScanner()
+        # Rolling counters for today's activity — maintained by the append
+        # hook so stats refreshes don't rescan the whole log
+        self._today_mmdd: str = datetime.now().strftime("%m/%d")
+        self._today_sessions: int = 0
+        self._today_messages: int = 0
+        # Specialized text-filter predicate + query fingerprint — kept in
+        # sync by watch_text_filter
+        self._text_matcher = None
+        self._query_fp: int = 0
+        self._home_str: str = str(Path.home())
         self._project_colors: dict[str, str] = {}
         self._projects: list[str] = []
         self._event_types = list(EVENT_TYPE_MAP.keys())
         self._project_idx = 0  # 0 = All
         self._event_type_idx = 0  # 0 = All
         self._filter_debounce_timer: Timer | None = None
+        self._filter_last_apply: float = 0.0
+        # Last rebuild's filter key + survivors — refined queries re-test
+        # only this list instead of the whole buffer
+        self._filter_cache: tuple[tuple, str, list[LogEntry]] | None = None
+        # Bumped per rebuild so a superseded async render is discarded
+        self._log_render_gen: int = 0
         self._stats_cache: dict = {}
+        self._activity_map: dict[str, dict] = {}  # dailyActivity keyed by date
         self._project_token_scanner = ProjectTokenScanner()
         self._active_tab: str = "tab-live"
+        self._active_tab_mask: int = _LIVE_TAB_MASK
         self._spinner_idx: int = 0
         self._stats_time_range: str = "Today"
         self._time_range_options: list[str] = ["Today", "7d", "All"]
@@ -1169,8 +1494,33 @@ class ClaudeDashboardApp(App):
         # Sidebar cache — avoid recomputing on every 0.5s tick
         self._sidebar_entry_count: int = 0
         self._sidebar_scan_gen: int = 0  # bumped each process scan
+        self._last_compact_rebuild: float = 0.0
+        self._compact_rebuild_timer: Timer | None = None
+        # Cached strftime output — refreshed on a 30s TTL
+        self._date_cache: tuple[str, list[str], str, set[str]] | None = None
+        self._date_cache_ts: float = 0.0
+        # Memoized date set for the current time range
+        self._valid_dates_key: tuple[str, int] | None = None
+        self._valid_dates: frozenset[str] | None = None
         self._cached_event_counts: dict = {}
-        self._cached_sessions: list[SessionNode] = []
+        # Agent tree memo — rebuilt only when the tailer revision moves
+        self._agent_tree_key: tuple[int, int] | None = None
+        self._agent_tree: tuple[list[SessionNode], dict[str, SessionNode]] | None = None
+        self._running_agents_by_norm: dict[str, list[AgentNode]] = {}
+        # Instances tab: per-pid rendered row cells, keyed by displayed fields
+        self._instances_row_cache: dict[int, tuple[tuple, tuple]] = {}
+        # Finer grain: individual cells keyed by (pid, column) and raw value,
+        # so a CPU move doesn't re-allocate the unchanged columns
+        self._cell_cache: dict[tuple[int, str], tuple[object, Text]] = {}
+        # Static portion of the Info cell — only the spinner frame changes
+        # between polls, so the badges around it are cached per pid
+        self._info_static_cache: dict[int, tuple] = {}
+        # Work deferred while its consumer tab is hidden
+        self._token_scan_dirty: bool = False
+        self._process_poll_skip: int = 0
+        # Instances tab change detection — skip rebuilds when static
+        self._last_instances_key: tuple | None = None
+        self._instances_rendered_spinner: bool = False
 
     def compose(self) -> ComposeResult:
         yield Static("", id="header-bar")
@@ -1179,7 +1529,7 @@ class ClaudeDashboardApp(App):
             with TabPane("1.Live", id="tab-live"):
                 with Horizontal(id="main-content"):
                     with Vertical(id="log-pane"):
-                        yield RichLog(id="event-log", highlight=False, markup=False, wrap=False, max_lines=5000)
+                        yield RichLog(id="event-log", highlight=False, markup=False, wrap=False, max_lines=MAX_LOG_LINES)
                         yield Input(placeholder="Filter logs (fuzzy)...", id="filter-input")
                     with Vertical(id="sidebar"):
                         yield Static("", id="stats-panel")
@@ -1202,6 +1552,23 @@ class ClaudeDashboardApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Resolve widgets once — query_one walks the DOM with a CSS
+        # selector match, too costly for the per-tick refresh paths.
+        self._header_bar = self.query_one("#header-bar", Static)
+        self._tabs = self.query_one("#tabs", TabbedContent)
+        self._event_log = self.query_one("#event-log", RichLog)
+        self._filter_input = self.query_one("#filter-input", Input)
+        self._stats_panel = self.query_one("#stats-panel", Static)
+        self._token_panel = self.query_one("#token-panel", Static)
+        self._instances_panel_header = self.query_one("#instances-panel-header", Static)
+        self._instances_panel_body = self.query_one("#instances-panel-body", Static)
+        self._filter_indicators = self.query_one("#filter-indicators", Static)
+        self._stats_summary = self.query_one("#stats-summary", Static)
+        self._stats_daily_tokens = self.query_one("#stats-daily-tokens", Static)
+        self._instances_header_bar = self.query_one("#instances-header-bar", Static)
+        self._instances_table = self.query_one("#instances-table", Static)
+        self._instances_footer = self.query_one("#instances-footer", Static)
+
         self.tailer.load_existing()
         self.scanner.scan()
         self._discover_projects()
@@ -1210,17 +1577,17 @@ class ClaudeDashboardApp(App):
         self._update_sidebar()
         self._update_header()
 
-        self._stats_cache = load_stats_cache()
+        self._set_stats_cache(load_stats_cache())
         self._project_token_scanner.load_cache()
         self._refresh_stats_tab()
         self._refresh_instances_tab()
 
-        self.query_one("#event-log", RichLog).focus()
+        self._event_log.focus()
         self.run_worker(self._initial_project_scan)
 
-        # Timers: poll + sidebar at 0.5s, header at 1s, processes at 3s, stats+scan at 5s
-        self.set_interval(0.5, self._poll_new_entries)
-        self.set_interval(0.5, self._update_sidebar)
+        # Timers: poll + sidebar share one 0.5s tick, header at 1s,
+        # processes at 3s, stats+scan at 5s
+        self.set_interval(0.5, self._tick_fast)
         self.set_interval(1.0, self._update_header)
         self.set_interval(3.0, self._poll_processes)
         self.set_interval(5.0, self._reload_stats_cache)
@@ -1235,6 +1602,11 @@ class ClaudeDashboardApp(App):
     def _activate_tab(self, tab_id: str) -> None:
         """Set the active tab and refresh its content if needed."""
         self._active_tab = tab_id
+        self._active_tab_mask = _TAB_MASKS.get(tab_id, 0)
+        if self._token_scan_dirty and tab_id != "tab-instances":
+            self._token_scan_dirty = False
+            self._project_token_scanner.scan_incremental()
+            self._lo_projects = self._project_token_scanner.lo_projects()
         if tab_id == "tab-stats":
             self._refresh_stats_tab()
         elif tab_id == "tab-instances":
@@ -1242,7 +1614,7 @@ class ClaudeDashboardApp(App):
 
     def action_switch_tab(self, tab_id: str) -> None:
         """Switch to a specific tab by ID."""
-        self.query_one("#tabs", TabbedContent).active = tab_id
+        self._tabs.active = tab_id
         self._activate_tab(tab_id)
 
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
@@ -1250,20 +1622,25 @@ class ClaudeDashboardApp(App):
         self._activate_tab(event.pane.id or "")
 
     def _is_live_tab(self) -> bool:
-        return self._active_tab == "tab-live"
+        return bool(self._active_tab_mask & _LIVE_TAB_MASK)
 
     def _is_stats_tab(self) -> bool:
-        return self._active_tab == "tab-stats"
+        return bool(self._active_tab_mask & _STATS_TAB_MASK)
 
     # ─── Header ───────────────────────────────────────────────────────────
 
     def _update_header(self) -> None:
+        # Piggyback the midnight rollover check on the 1s header tick
+        today_mmdd = self._current_date_sets()[0]
+        if today_mmdd != self._today_mmdd:
+            self._roll_today_counters(today_mmdd)
+
         now = datetime.now().strftime("%I:%M %p")
         total = len(self.scanner.instances)
         active = self.scanner.active_count
         mem = self.scanner.total_mem_mb
         mem_str = f"{mem / 1024:.1f}GB" if mem >= 1024 else f"{mem:.0f}MB"
-        header = self.query_one("#header-bar", Static)
+        header = self._header_bar
         scope_label = "  │  [LO]" if self._lo_scope else ""
         header.update(
             f" 🟢 Claude Dashboard  │  {total} instances ({active} active)  │  {mem_str} RAM  │  {now}{scope_label}"
@@ -1271,6 +1648,16 @@ class ClaudeDashboardApp(App):
 
     # ─── Polling ──────────────────────────────────────────────────────────
 
+    def _tick_fast(self) -> None:
+        """Single 0.5s heartbeat: poll the log first, then the sidebar.
+
+        One timer instead of two avoids both callbacks firing in the same
+        frame independently and guarantees the sidebar sees this tick's
+        entries.
+        """
+        self._poll_new_entries()
+        self._update_sidebar()
+
     def _poll_new_entries(self) -> None:
         new_entries = self.tailer.poll()
         if not new_entries:
@@ -1278,14 +1665,53 @@ class ClaudeDashboardApp(App):
 
         self._discover_projects()
 
-        if not self._has_active_filters() and not self.compact_mode:
-            log_widget = self.query_one("#event-log", RichLog)
-            for entry in new_entries:
-                self._write_entry(log_widget, entry)
-            if self.live_tail:
-                log_widget.scroll_end(animate=False)
+        if self.compact_mode:
+            # Compact groups can merge with the new tail — needs a full
+            # rebuild, but throttled so bursts don't re-render every poll.
+            self._throttled_compact_rebuild()
+            return
+
+        # Append-only: run the new entries through the active filters and
+        # write just the survivors. Full rebuilds happen only when filters
+        # change (handled by the action/filter handlers). With no filters
+        # at all — the steady-state streaming case — skip straight to the
+        # write without any filter evaluation.
+        if self._has_active_filters():
+            entries = self._filter_entries_by_scope(self._filter_entries_by_time(new_entries))
+            if self.text_filter or self.project_filter or self.event_type_filter:
+                entries = _filter_entries(
+                    entries, self._text_matcher, self.project_filter,
+                    self.event_type_filter, self._query_fp,
+                )
+            if not entries:
+                return
+        else:
+            entries = new_entries
+        log_widget = self._event_log
+        # One write per poll batch — a single renderable means one
+        # compositor update instead of one per line under burst load
+        if len(entries) == 1:
+            log_widget.write(self._render_entry(entries[0]))
         else:
+            log_widget.write(Group(*[
+                self._render_run(e, n) for e, n in _dedupe_consecutive(entries)
+            ]))
+        if self.live_tail:
+            log_widget.scroll_end(animate=False)
+
+    def _throttled_compact_rebuild(self) -> None:
+        """Rebuild the compacted log at most every 2s, deferring the rest."""
+        now = time.monotonic()
+        if now - self._last_compact_rebuild >= 2.0:
+            self._last_compact_rebuild = now
             self._rebuild_log()
+        elif self._compact_rebuild_timer is None:
+            self._compact_rebuild_timer = self.set_timer(2.0, self._deferred_compact_rebuild)
+
+    def _deferred_compact_rebuild(self) -> None:
+        self._compact_rebuild_timer = None
+        self._last_compact_rebuild = time.monotonic()
+        self._rebuild_log()
 
     def _has_active_filters(self) -> bool:
         return bool(self.text_filter or self.project_filter or self.event_type_filter or self._stats_time_range != "All" or self._lo_scope)
@@ -1294,64 +1720,132 @@ class ClaudeDashboardApp(App):
 
     def _rebuild_log(self) -> None:
         """Full rebuild of the log display with current filters."""
-        log_widget = self.query_one("#event-log", RichLog)
-        log_widget.clear()
-
-        entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
-        filtered = [
-            e for e in entries
-            if e.matches_filter(self.text_filter, self.project_filter, self.event_type_filter)
-        ]
+        # Typing refines the previous query most of the time — when every
+        # other filter is unchanged and the new text extends the old one,
+        # re-test only the previous survivors instead of the whole buffer
+        base_key = (
+            self.project_filter, self.event_type_filter, self._stats_time_range,
+            self._lo_scope, self.tailer.revision,
+        )
+        cached = self._filter_cache
+        if (
+            cached is not None and cached[0] == base_key
+            and self.text_filter.startswith(cached[1])
+        ):
+            matcher = self._text_matcher
+            qfp = self._query_fp
+            if matcher is None:
+                filtered = cached[2]
+            elif qfp:
+                filtered = [e for e in cached[2] if (e.fp & qfp) == qfp and matcher(e.raw)]
+            else:
+                filtered = [e for e in cached[2] if matcher(e.raw)]
+        else:
+            entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
+            filtered = _filter_entries(
+                entries, self._text_matcher, self.project_filter,
+                self.event_type_filter, self._query_fp,
+            )
+        self._filter_cache = (base_key, self.text_filter, filtered)
 
         if self.compact_mode:
             filtered = self._compact_entries(filtered)
 
-        for idx, entry in enumerate(filtered):
-            if idx > 0 and isinstance(entry, LogEntry) and "🟢" in entry.event and "Session started" in entry.event:
-                log_widget.write(Text("─" * 60, style="dim"))
-            self._write_entry(log_widget, entry)
+        # The widget only retains MAX_LOG_LINES; anything older would be
+        # formatted and immediately discarded, so don't build it at all
+        if len(filtered) > MAX_LOG_LINES:
+            filtered = filtered[-MAX_LOG_LINES:]
+
+        # Large batches format off the message loop so keystrokes stay
+        # responsive; small ones aren't worth the thread hop. The
+        # generation tag lets a slow superseded render be discarded —
+        # exclusive=True can't interrupt a sync thread function mid-run,
+        # so an old worker could otherwise land after a newer apply.
+        self._log_render_gen += 1
+        gen = self._log_render_gen
+        if len(filtered) > 1000:
+            self.run_worker(
+                partial(self._render_log_batch, filtered, gen),
+                thread=True, exclusive=True, group="log-render",
+            )
+        else:
+            self._apply_log_lines(self._build_log_lines(filtered), gen)
+
+    def _build_log_lines(self, filtered: list) -> list[Text]:
+        """Format filtered entries (plus session separators) into lines."""
+        lines: list[Text] = []
+        for idx, (entry, count) in enumerate(_dedupe_consecutive(filtered)):
+            if idx > 0 and isinstance(entry, LogEntry) and entry.kind == _KIND_SESSION_START:
+                lines.append(Text("─" * 60, style="dim"))
+            lines.append(self._render_run(entry, count))
+        return lines
+
+    def _render_run(self, entry, count: int) -> Text:
+        """Render an entry, suffixed with (×N) for a collapsed duplicate run."""
+        line = self._render_entry(entry)
+        if count > 1:
+            line = line.copy()
+            line.append(f" (×{count})", "dim")
+        return line
+
+    def _render_log_batch(self, filtered: list, gen: int) -> None:
+        """Thread worker: format a large batch, then apply on the UI thread."""
+        lines = self._build_log_lines(filtered)
+        if get_current_worker().is_cancelled:
+            return
+        self.call_from_thread(self._apply_log_lines, lines, gen)
 
+    def _apply_log_lines(self, lines: list[Text], gen: int) -> None:
+        """Swap the log widget's content for freshly formatted lines."""
+        if gen != self._log_render_gen:
+            return  # superseded by a newer rebuild while formatting
+        log_widget = self._event_log
+        log_widget.clear()
+        if lines:
+            log_widget.write(Group(*lines))
         if self.live_tail:
             log_widget.scroll_end(animate=False)
-
         self._update_filter_indicators()
 
-    def _build_entry_prefix(self, entry: LogEntry) -> Text:
-        """Build the shared timestamp | project | branch prefix for a log line."""
-        text = Text()
-        text.append(entry.timestamp, style="dim")
+    def _assemble_entry(self, entry: LogEntry, body: tuple[str, str]) -> Text:
+        """Assemble prefix + event body into a Text in one shot.
+
+        Text.assemble builds all spans at once instead of growing the
+        span list with ~8 append calls per line.
+        """
         if entry.project:
-            color = _project_color(entry.project, self._project_colors)
-            text.append(" │ ", style="dim")
-            text.append(entry.project, style=color)
-            text.append(" │ ", style="dim")
-            text.append(entry.branch or "-", style="dim")
-        text.append(" │ ", style="dim")
-        return text
+            color = entry.color
+            if not color:
+                color = entry.color = _project_color(entry.project, self._project_colors)
+            return Text.assemble(
+                (entry.timestamp, "dim"),
+                (" │ ", "dim"),
+                (entry.project, color),
+                (" │ ", "dim"),
+                (entry.branch or "-", "dim"),
+                (" │ ", "dim"),
+                body,
+            )
+        return Text.assemble((entry.timestamp, "dim"), (" │ ", "dim"), body)
 
-    def _write_entry(self, log_widget: RichLog, entry) -> None:
-        """Write a single LogEntry (or compact group) to the log widget."""
+    def _render_entry(self, entry) -> Text:
+        """Render a single LogEntry (or compact group) to a Text line."""
         if isinstance(entry, dict):
             sample = entry["sample"]
             count = entry["count"]
-            text = self._build_entry_prefix(sample)
-            text.append(f"{sample.emoji} ", style=sample.style)
             base = sample.event
             if sample.emoji:
                 base = base.replace(sample.emoji, "").strip()
             if ":" in base:
                 base = base.split(":")[0].strip()
-            text.append(f"{base} (x{count})", style=sample.style)
-            log_widget.write(text)
-        else:
-            text = self._build_entry_prefix(entry)
-            display_event = entry.event.replace("📋 Task created", "📋 Todo created").replace("📋 Task completed", "📋 Todo completed")
-            # Shorten model IDs in session started lines: [claude-opus-4-6] → [Opus 4.6]
-            m = re.search(r"\[(claude-[^\]]+)\]", display_event)
-            if m:
-                display_event = display_event.replace(m.group(0), f"[{format_model_name(m.group(1))}]")
-            text.append(display_event, style=entry.style)
-            log_widget.write(text)
+            body = (f"{sample.emoji} {base} (x{count})", sample.style)
+            return self._assemble_entry(sample, body)
+        # Entries are immutable once parsed, so the assembled line is too —
+        # rebuilds reuse it instead of re-spanning every entry
+        rendered = entry.rendered
+        if rendered is None:
+            rendered = entry.rendered = self._assemble_entry(entry, (entry.display_event, entry.style))
+        return rendered
 
     def _compact_entries(self, entries: list[LogEntry]) -> list:
         """Collapse consecutive same-type events."""
@@ -1382,27 +1876,48 @@ class ClaudeDashboardApp(App):
 
     # ─── Sidebar ──────────────────────────────────────────────────────────
 
+    def _current_date_sets(self) -> tuple[str, list[str], str, set[str]]:
+        """Cached (today MM/DD, 7d MM/DD list, today YYYY-MM-DD, 7d YYYY-MM-DD set).
+
+        datetime.now() + strftime are called from several per-tick paths;
+        the results only change at midnight, so refresh on a 30s TTL.
+        """
+        now_mono = time.monotonic()
+        if self._date_cache is not None and now_mono - self._date_cache_ts < 30.0:
+            return self._date_cache
+        now = datetime.now()
+        days = [now - timedelta(days=i) for i in range(6, -1, -1)]
+        cache = (
+            now.strftime("%m/%d"),
+            [d.strftime("%m/%d") for d in days],
+            now.strftime("%Y-%m-%d"),
+            {d.strftime("%Y-%m-%d") for d in days},
+        )
+        self._date_cache = cache
+        self._date_cache_ts = now_mono
+        return cache
+
     def _filter_entries_by_time(self, entries: list[LogEntry]) -> list[LogEntry]:
         """Filter log entries by the current time range selection (Today, 7d, or All)."""
         rng = self._stats_time_range
         if rng == "All":
             return entries
 
-        now = datetime.now()
+        today_mmdd, week_mmdd, _, _ = self._current_date_sets()
         if rng == "Today":
-            valid_dates = {now.strftime("%m/%d")}
+            valid_dates = [today_mmdd]
         elif rng == "7d":
-            valid_dates = {(now - timedelta(days=i)).strftime("%m/%d") for i in range(7)}
+            valid_dates = week_mmdd
         else:
             return entries
 
-        filtered = []
-        for entry in entries:
-            ts = entry.timestamp.strip()
-            m = re.match(r"(\d{2}/\d{2})", ts)
-            if m and m.group(1) in valid_dates:
-                filtered.append(entry)
-        return filtered
+        # The full log is pre-bucketed by date — concatenate the buckets
+        # instead of scanning every entry.
+        if entries is self.tailer.all_entries:
+            return self.tailer.entries_for_dates(valid_dates)
+
+        valid = set(valid_dates)
+        return [e for e in entries if e.date_prefix in valid]
 
     def _filter_entries_by_scope(self, entries: list[LogEntry]) -> list[LogEntry]:
         """Filter entries to LO projects only when scope is active."""
@@ -1425,16 +1940,51 @@ class ClaudeDashboardApp(App):
         if data_changed:
             self._sidebar_entry_count = entry_count
             self._sidebar_scan_gen = scan_gen
-            filtered_entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
-            raw_lines = [e.raw for e in filtered_entries]
-            self._cached_event_counts = count_events(raw_lines)
-            self._cached_sessions = build_agent_tree(self.tailer.all_entries)
-            self._update_stats_panel(self._cached_event_counts)
-            self._update_token_panel()
+            # Heavy lifting (count_events + build_agent_tree over the full
+            # log) runs off the UI thread so input stays responsive.
+            self.run_worker(
+                self._recompute_sidebar_data,
+                thread=True, exclusive=True, group="sidebar",
+            )
 
         # Instances panel always re-renders (cheap) for spinner animation
         self._update_instances_panel()
 
+    def _get_agent_tree(self) -> tuple[list[SessionNode], dict[str, SessionNode]]:
+        """Agent tree + active-session map, memoized on the tailer revision.
+
+        The memo key includes a 30s time bucket: build_agent_tree expires
+        agents by wall clock (lost finish events), so a quiet log must
+        still re-run the build eventually or a stale spinner sticks
+        forever.
+        """
+        key = (self.tailer.revision, int(time.monotonic() // 30))
+        if self._agent_tree is None or self._agent_tree_key != key:
+            sessions = build_agent_tree(self.tailer.all_entries)
+            session_map = _build_active_session_map(sessions)
+            # Prefetch per-project running agents so the instance loops
+            # don't filter session.agents once per row per poll
+            self._running_agents_by_norm = {
+                k: [a for a in s.agents if a.is_running] for k, s in session_map.items()
+            }
+            self._agent_tree = (sessions, session_map)
+            self._agent_tree_key = key
+        return self._agent_tree
+
+    def _recompute_sidebar_data(self) -> None:
+        """Compute event counts and the agent tree in a thread worker."""
+        filtered_entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
+        raw_lines = [e.raw for e in filtered_entries]
+        event_counts = count_events(raw_lines)
+        self._get_agent_tree()  # warm the tree memo off the UI thread
+        self.call_from_thread(self._apply_sidebar_data, event_counts)
+
+    def _apply_sidebar_data(self, event_counts: dict) -> None:
+        """Apply worker-computed sidebar data on the UI thread."""
+        self._cached_event_counts = event_counts
+        self._update_stats_panel(event_counts)
+        self._update_token_panel()
+
     def _update_stats_panel(self, counts: dict) -> None:
         table = Table(
             show_header=False, show_edge=False, box=None, padding=(0, 1),
@@ -1468,19 +2018,30 @@ class ClaudeDashboardApp(App):
         total = sum(counts.values())
         table.add_row("[bold]Total[/]", f"[bold]{total}[/]")
 
-        self.query_one("#stats-panel", Static).update(table)
+        self._stats_panel.update(table)
+
+    def _get_daily_token_dates(self) -> frozenset[str] | None:
+        """Return the set of YYYY-MM-DD dates for the current time range, or None for All.
 
-    def _get_daily_token_dates(self) -> set[str] | None:
-        """Return the set of YYYY-MM-DD dates for the current time range, or None for All."""
+        Memoized per (range, date-cache generation) — a stats refresh calls
+        this several times (summary, table, range filter).
+        """
         rng = self._stats_time_range
         if rng == "All":
             return None
-        now = datetime.now()
+        _, _, today_ymd, week_ymd = self._current_date_sets()
+        key = (rng, id(self._date_cache))
+        if self._valid_dates_key == key:
+            return self._valid_dates
         if rng == "Today":
-            return {now.strftime("%Y-%m-%d")}
-        if rng == "7d":
-            return {(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)}
-        return None
+            dates = frozenset((today_ymd,))
+        elif rng == "7d":
+            dates = frozenset(week_ymd)
+        else:
+            dates = None
+        self._valid_dates_key = key
+        self._valid_dates = dates
+        return dates
 
     def _add_model_rows(self, table: Table, models: list[tuple[str, int, int, int]], empty_label: str = "[dim]No data[/]") -> None:
         """Add per-model rows with optional cache ratio to a token table.
@@ -1529,7 +2090,7 @@ class ClaudeDashboardApp(App):
                 for mid, t in model_totals.items()
             ]
             self._add_model_rows(table, models)
-            self.query_one("#token-panel", Static).update(table)
+            self._token_panel.update(table)
             return
 
         scope_label = " — LO" if self._lo_scope else ""
@@ -1557,7 +2118,7 @@ class ClaudeDashboardApp(App):
             ]
             self._add_model_rows(table, models)
 
-        self.query_one("#token-panel", Static).update(table)
+        self._token_panel.update(table)
 
     def _update_instances_panel(self) -> None:
         """Sidebar: clean list of instances — just status icon + project name.
@@ -1575,31 +2136,25 @@ class ClaudeDashboardApp(App):
         if active > 0:
             header_text.append(f", {active} active", style="bold #87d787")
         header_text.append(")", style="bold")
-        self.query_one("#instances-panel-header", Static).update(header_text)
+        self._instances_panel_header.update(header_text)
 
         if not instances:
-            self.query_one("#instances-panel-body", Static).update(
+            self._instances_panel_body.update(
                 Text("  No Claude instances detected", style="dim")
             )
             return
 
         spinner = BRAILLE_SPINNER[self._spinner_idx % len(BRAILLE_SPINNER)]
 
-        # Use cached sessions for enrichment (subagents)
-        session_map = _build_active_session_map(self._cached_sessions)
-
-        # Deduplicate: one entry per project, keep most active
+        # Deduplicate: one entry per project, keep most active. `instances`
+        # is already sorted active-first/CPU-desc by scan(), so the first
+        # instance seen per project is the one to keep and dict insertion
+        # order preserves the display order — no second sort needed.
         by_project: dict[str, ProcessInstance] = {}
         for inst in instances:
-            key = inst.project_name.lower()
-            prev = by_project.get(key)
-            if prev is None or inst.cpu_percent > prev.cpu_percent:
-                by_project[key] = inst
-
-        sorted_instances = sorted(
-            by_project.values(),
-            key=lambda x: (-x.is_active, -x.cpu_percent, x.project_name.lower()),
-        )
+            by_project.setdefault(inst.project_name_lower, inst)
+
+        sorted_instances = list(by_project.values())
 
         text = Text()
         max_sidebar = 30
@@ -1617,15 +2172,16 @@ class ClaudeDashboardApp(App):
             branch = "└── " if is_last_inst else "├── "
             continuation = "    " if is_last_inst else "│   "
 
-            color = _project_color(inst.project_name, self._project_colors)
+            color = inst.color
+            if not color:
+                color = inst.color = _project_color(inst.project_name, self._project_colors)
             name = inst.project_name[:20]
 
-            # Match with event log for subagents
-            norm_key = _normalize_project_key(inst.project_name)
-            session = session_map.get(norm_key)
-            running_agents = []
-            if session:
-                running_agents = [a for a in session.agents if a.is_running]
+            # Match with event log for subagents — prefetched per project
+            # when the agent tree cache was last rebuilt
+            running_agents = self._running_agents_by_norm.get(
+                _normalize_project_key(inst.project_name), []
+            )
 
             # Branch + status icon + name
             text.append(f"  {branch}", style="dim #555555")
@@ -1652,7 +2208,7 @@ class ClaudeDashboardApp(App):
 
             shown += 1
 
-        self.query_one("#instances-panel-body", Static).update(text)
+        self._instances_panel_body.update(text)
 
     def _render_agent_text(self, text: Text, agent: AgentNode, spinner: str, is_last: bool, prefix: str) -> None:
         """Render a running agent node with ASCII tree branching."""
@@ -1660,13 +2216,12 @@ class ClaudeDashboardApp(App):
         text.append(prefix, style="dim #555555")
         text.append(branch, style="dim #555555")
 
-        atype = agent.agent_type[:14]
-        color = "#2e8b57" if atype == "Plan" else "#5fd7d7"
+        color = agent.color
         text.append(f"{spinner} ", style=f"bold {color}")
-        text.append(atype, style=f"bold {color}")
+        text.append(agent.short_type, style=f"bold {color}")
         text.append("\n")
 
-        running_children = [c for c in agent.children if c.is_running]
+        running_children = agent.running_children
         child_prefix = prefix + ("    " if is_last else "│   ")
         for i, child in enumerate(running_children):
             child_is_last = (i == len(running_children) - 1)
@@ -1676,18 +2231,55 @@ class ClaudeDashboardApp(App):
 
     def _poll_processes(self) -> None:
         """Rescan running Claude processes."""
+        # The Live sidebar and the Instances tab consume scan results; the
+        # Stats tab only needs them for the header counts, so drop to a
+        # 1-in-3 cadence (~9s) while it is focused.
+        if self._is_stats_tab():
+            self._process_poll_skip += 1
+            if self._process_poll_skip % 3:
+                return
         self.scanner.scan()
         if self._is_instances_tab():
             self._refresh_instances_tab()
 
     def _is_instances_tab(self) -> bool:
-        return self._active_tab == "tab-instances"
+        return bool(self._active_tab_mask & _INSTANCES_TAB_MASK)
+
+    def _cell(self, pid: int, col: str, value) -> Text | None:
+        """Return the cached Text for an instances-table cell, or None if stale."""
+        cached = self._cell_cache.get((pid, col))
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        return None
+
+    def _cell_put(self, pid: int, col: str, value, text: Text) -> Text:
+        """Cache a freshly built instances-table cell and return it."""
+        self._cell_cache[(pid, col)] = (value, text)
+        return text
 
     def _refresh_instances_tab(self) -> None:
         """Full render of the Instances tab table with child process info."""
         instances = self.scanner.instances
         if self._lo_scope:
             instances = [i for i in instances if i.project_name in self._lo_projects]
+
+        # Most polls change nothing — skip the rebuild when all displayed
+        # fields match the previous render. Renders that show a spinner
+        # (shell commands, running agents) must repaint for the animation.
+        content_key = (
+            tuple(
+                (i.pid, i.cpu_percent, i.mem_mb, i.is_active, i.uptime_display,
+                 i.claude_version, i.mcp_server_count, i.has_shell,
+                 i.shell_command, i.has_caffeinate, i.cwd)
+                for i in instances
+            ),
+            self.tailer.revision,
+            self._lo_scope,
+        )
+        if content_key == self._last_instances_key and not self._instances_rendered_spinner:
+            return
+        self._last_instances_key = content_key
+
         total = len(instances)
         active = sum(1 for i in instances if i.is_active)
         mem = sum(i.mem_mb for i in instances)
@@ -1699,18 +2291,19 @@ class ClaudeDashboardApp(App):
         header.append(f"({total})", style="bold")
         if active > 0:
             header.append(f"  •  {active} active", style="bold #87d787")
-        self.query_one("#instances-header-bar", Static).update(header)
 
         if not instances:
-            self.query_one("#instances-table", Static).update(
-                Text("  No Claude instances detected.\n  Start Claude in a terminal to see it here.", style="dim")
-            )
-            self.query_one("#instances-footer", Static).update("")
+            self._instances_rendered_spinner = False
+            with self.batch_update():
+                self._instances_header_bar.update(header)
+                self._instances_table.update(
+                    Text("  No Claude instances detected.\n  Start Claude in a terminal to see it here.", style="dim")
+                )
+                self._instances_footer.update("")
             return
 
-        # Build session map for enrichment
-        sessions = build_agent_tree(self.tailer.all_entries)
-        session_map = _build_active_session_map(sessions)
+        # Build session map for enrichment (memoized on the tailer revision)
+        _sessions, session_map = self._get_agent_tree()
 
         spinner = BRAILLE_SPINNER[self._spinner_idx % len(BRAILLE_SPINNER)]
 
@@ -1728,85 +2321,182 @@ class ClaudeDashboardApp(App):
         table.add_column("Info", min_width=12, max_width=20)
         table.add_column("Directory", style="dim", ratio=1)
 
+        live_pids: set[int] = set()
+        rendered_spinner = False
+        add_row = table.add_row  # bound once for the per-instance loop
         for inst in instances:
-            color = _project_color(inst.project_name, self._project_colors)
-
-            # Status
-            status = Text("🟢" if inst.is_active else "🟡")
-
-            # Project name
-            proj = Text(inst.project_name[:20], style=f"bold {color}")
-
-            # CPU
-            cpu_val = f"{inst.cpu_percent:.1f}%"
-            if inst.cpu_percent > 30:
-                cpu = Text(cpu_val, style="bold #ff5f5f")
-            elif inst.is_active:
-                cpu = Text(cpu_val, style="bold #87d787")
-            else:
-                cpu = Text(cpu_val, style="dim")
-
-            # Mem
-            mem_text = Text(f"{inst.mem_mb:.0f}MB", style="dim")
-
-            # Uptime
-            uptime = Text(inst.uptime_display, style="dim")
-
-            # Version
-            ver = Text(inst.claude_version or "-", style="dim")
-
-            # Info column: MCP count, shell, caffeinate badges
-            info_parts: list[tuple[str, str]] = []
-            if inst.mcp_server_count > 0:
-                info_parts.append((f"{inst.mcp_server_count} MCP", "#af87ff"))
+            live_pids.add(inst.pid)
             if inst.has_shell:
-                cmd_label = inst.shell_command or "cmd"
-                info_parts.append((f"{spinner} {cmd_label}", "bold #d7af5f"))
-            if inst.has_caffeinate:
-                info_parts.append(("☕", "#87d787"))
+                rendered_spinner = True
 
             # Match with event log for model info
             norm_key = _normalize_project_key(inst.project_name)
             session = session_map.get(norm_key)
-            if session and session.model:
-                info_parts.append((format_model_name(session.model), "dim"))
-
-            info = Text()
-            for i, (label, style) in enumerate(info_parts):
-                if i > 0:
-                    info.append("  ")
-                info.append(label, style=style)
-
-            # Directory (shortened)
-            cwd = inst.cwd.replace(str(Path.home()), "~")
-            dir_text = Text(cwd, style="dim")
 
-            table.add_row(status, proj, cpu, mem_text, uptime, ver, info, dir_text)
+            # Reuse the rendered cells when every displayed field is
+            # unchanged since the last refresh — most rows are idle, so
+            # most polls rebuild nothing. The spinner only enters the key
+            # for shell rows, which actually display it.
+            row_key = (
+                inst.project_name, inst.is_active, inst.cpu_percent, inst.mem_mb,
+                inst.uptime_display, inst.claude_version, inst.mcp_server_count,
+                inst.has_shell, inst.shell_command, inst.has_caffeinate, inst.cwd,
+                session.model if session else "",
+                spinner if inst.has_shell else "",
+            )
+            cached = self._instances_row_cache.get(inst.pid)
+            if cached is not None and cached[0] == row_key:
+                add_row(*cached[1])
+            else:
+                color = inst.color
+                if not color:
+                    color = inst.color = _project_color(inst.project_name, self._project_colors)
+
+                # A partial row change (usually CPU ticking over) still lets
+                # the untouched columns reuse their Text objects.
+                pid = inst.pid
+
+                # Status
+                status = self._cell(pid, "st", inst.is_active)
+                if status is None:
+                    status = self._cell_put(pid, "st", inst.is_active, Text("🟢" if inst.is_active else "🟡"))
+
+                # Project name
+                proj = self._cell(pid, "proj", (inst.project_name, color))
+                if proj is None:
+                    proj = self._cell_put(
+                        pid, "proj", (inst.project_name, color),
+                        Text(inst.project_name[:20], style=f"bold {color}"),
+                    )
+
+                # CPU
+                cpu_key = (inst.cpu_percent, inst.is_active)
+                cpu = self._cell(pid, "cpu", cpu_key)
+                if cpu is None:
+                    cpu_val = f"{inst.cpu_percent:.1f}%"
+                    if inst.cpu_percent > 30:
+                        cpu = Text(cpu_val, style="bold #ff5f5f")
+                    elif inst.is_active:
+                        cpu = Text(cpu_val, style="bold #87d787")
+                    else:
+                        cpu = Text(cpu_val, style="dim")
+                    self._cell_put(pid, "cpu", cpu_key, cpu)
+
+                # Mem
+                mem_text = self._cell(pid, "mem", inst.mem_mb)
+                if mem_text is None:
+                    mem_text = self._cell_put(pid, "mem", inst.mem_mb, Text(f"{inst.mem_mb:.0f}MB", style="dim"))
+
+                # Uptime
+                uptime = self._cell(pid, "up", inst.uptime_display)
+                if uptime is None:
+                    uptime = self._cell_put(pid, "up", inst.uptime_display, Text(inst.uptime_display, style="dim"))
+
+                # Version
+                ver = self._cell(pid, "ver", inst.claude_version)
+                if ver is None:
+                    ver = self._cell_put(pid, "ver", inst.claude_version, Text(inst.claude_version or "-", style="dim"))
+
+                # Info column: MCP count, shell, caffeinate badges. Only the
+                # spinner frame changes per poll, so the surrounding badges
+                # are cached and just re-composed around it.
+                info_key = (
+                    inst.mcp_server_count, inst.has_shell, inst.has_caffeinate,
+                    session.model if session else "",
+                )
+                cached_info = self._info_static_cache.get(pid)
+                if cached_info is None or cached_info[0] != info_key:
+                    if inst.has_shell:
+                        # Split around the shell badge: prefix with trailing
+                        # separator, suffix with leading separators
+                        pre = Text()
+                        if inst.mcp_server_count > 0:
+                            pre.append(f"{inst.mcp_server_count} MCP", style="#af87ff")
+                            pre.append("  ")
+                        post = Text()
+                        if inst.has_caffeinate:
+                            post.append("  ")
+                            post.append("☕", style="#87d787")
+                        if session and session.model:
+                            post.append("  ")
+                            post.append(format_model_name(session.model), style="dim")
+                        cached_info = (info_key, pre, post)
+                    else:
+                        # No spinner — the whole cell is static
+                        full = Text()
+                        if inst.mcp_server_count > 0:
+                            full.append(f"{inst.mcp_server_count} MCP", style="#af87ff")
+                        if inst.has_caffeinate:
+                            if full.plain:
+                                full.append("  ")
+                            full.append("☕", style="#87d787")
+                        if session and session.model:
+                            if full.plain:
+                                full.append("  ")
+                            full.append(format_model_name(session.model), style="dim")
+                        cached_info = (info_key, full, None)
+                    self._info_static_cache[pid] = cached_info
+
+                if cached_info[2] is None:
+                    info = cached_info[1]
+                else:
+                    info = Text()
+                    info.append_text(cached_info[1])
+                    info.append(f"{spinner} {inst.shell_command or 'cmd'}", style="bold #d7af5f")
+                    info.append_text(cached_info[2])
+
+                # Directory (shortened) — only the leading occurrence is home
+                dir_text = self._cell(pid, "cwd", inst.cwd)
+                if dir_text is None:
+                    cwd = inst.cwd
+                    if cwd.startswith(self._home_str):
+                        cwd = cwd.replace(self._home_str, "~", 1)
+                    dir_text = self._cell_put(pid, "cwd", inst.cwd, Text(cwd, style="dim"))
+
+                cells = (status, proj, cpu, mem_text, uptime, ver, info, dir_text)
+                self._instances_row_cache[inst.pid] = (row_key, cells)
+                add_row(*cells)
 
             # Show running subagents as indented sub-rows
-            if session:
-                running_agents = [a for a in session.agents if a.is_running]
+            running_agents = self._running_agents_by_norm.get(norm_key)
+            if running_agents:
+                rendered_spinner = True
                 for agent in running_agents:
-                    atype = agent.agent_type[:14]
-                    color = "#2e8b57" if atype == "Plan" else "#5fd7d7"
                     agent_text = Text()
-                    agent_text.append(f"  {spinner} ", style=f"bold {color}")
-                    agent_text.append(atype, style=color)
+                    agent_text.append(f"  {spinner} ", style=f"bold {agent.color}")
+                    agent_text.append(agent.short_type, style=agent.color)
                     empty = Text("")
-                    table.add_row(empty, agent_text, empty, empty, empty, empty, empty, empty)
+                    add_row(empty, agent_text, empty, empty, empty, empty, empty, empty)
+
+        self._instances_rendered_spinner = rendered_spinner
 
-        self.query_one("#instances-table", Static).update(table)
+        # Drop cache entries for processes that have exited
+        if len(self._instances_row_cache) > len(live_pids):
+            self._instances_row_cache = {
+                pid: v for pid, v in self._instances_row_cache.items() if pid in live_pids
+            }
+            self._cell_cache = {
+                k: v for k, v in self._cell_cache.items() if k[0] in live_pids
+            }
+            self._info_static_cache = {
+                pid: v for pid, v in self._info_static_cache.items() if pid in live_pids
+            }
 
         # Footer
         mem_str = f"{mem / 1024:.1f}GB" if mem >= 1024 else f"{mem:.0f}MB"
         footer = Text()
         footer.append(f"  Total: {mem_str} RAM across {total} instances", style="dim")
-        self.query_one("#instances-footer", Static).update(footer)
+
+        # One compositor pass for all three widgets instead of three
+        with self.batch_update():
+            self._instances_header_bar.update(header)
+            self._instances_table.update(table)
+            self._instances_footer.update(footer)
 
     # ─── Project discovery ────────────────────────────────────────────────
 
     def _discover_projects(self) -> None:
-        seen = {e.project for e in self.tailer.all_entries if e.project}
+        seen = set(self.tailer.projects())
         seen.update(self._project_token_scanner.all_projects())
         self._projects = sorted(seen)
 
@@ -1819,7 +2509,7 @@ class ClaudeDashboardApp(App):
             today_mmdd = datetime.now().strftime("%m/%d")
             first_time = ""
             for entry in self.tailer.all_entries:
-                if "🟢" in entry.event and "Session started" in entry.event:
+                if entry.kind == _KIND_SESSION_START:
                     if entry.timestamp.strip().startswith(today_mmdd):
                         first_time = entry.timestamp.strip()
                         break
@@ -1852,40 +2542,77 @@ class ClaudeDashboardApp(App):
             filters.append("compact:on")
 
         time_label = self._build_time_label()
-        indicator = self.query_one("#filter-indicators", Static)
+        indicator = self._filter_indicators
 
         if filters:
             right = "  ".join(filters)
             indicator.update(f"{time_label}  │  {right}  (t)")
         else:
             indicator.update(f"{time_label}  (t)")
-        indicator.add_class("visible")
+        # add_class goes through the stylesheet recompute path even when
+        # nothing changes, and this runs on every poll
+        if not indicator.has_class("visible"):
+            indicator.add_class("visible")
 
     # ─── Tab 2: Stats ────────────────────────────────────────────────────
 
+    def _set_stats_cache(self, data: dict) -> None:
+        """Install a freshly loaded stats cache plus derived lookups."""
+        self._stats_cache = data
+        self._activity_map = {d.get("date", ""): d for d in data.get("dailyActivity", [])}
+        # Sort once at load — the daily table renders newest-first on every
+        # refresh, and the per-range filter preserves order
+        daily_model = data.get("dailyModelTokens")
+        if daily_model:
+            daily_model.sort(key=lambda d: d.get("date", ""), reverse=True)
+
     def _reload_stats_cache(self) -> None:
-        self._stats_cache = load_stats_cache()
+        self._set_stats_cache(load_stats_cache())
+        if self._is_instances_tab():
+            # Neither the Stats tab nor the Live token panel is visible —
+            # defer the JSONL scan until the user switches back.
+            self._token_scan_dirty = True
+            return
         self._project_token_scanner.scan_incremental()
         self._lo_projects = self._project_token_scanner.lo_projects()
         if self._is_stats_tab():
             self._refresh_stats_tab()
 
+    def _observe_entry(self, entry: LogEntry) -> None:
+        """Tailer append hook — keep the rolling today counters current."""
+        if entry.date_prefix != self._today_mmdd:
+            return
+        if entry.kind == _KIND_SESSION_START:
+            self._today_sessions += 1
+        elif entry.kind == _KIND_FINISHED:
+            self._today_messages += 1
+
+    def _roll_today_counters(self, today_mmdd: str) -> None:
+        """Reset and recount the today counters after a date rollover."""
+        self._today_mmdd = today_mmdd
+        self._today_sessions = 0
+        self._today_messages = 0
+        for entry in self.tailer.entries_for_dates([today_mmdd]):
+            self._observe_entry(entry)
+
     def _count_live_today_activity(self) -> tuple[int, int]:
         """Count today's sessions and messages from the live event log.
 
         Returns (sessions, messages) for entries matching today's date.
         """
-        live_entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
-        today_mmdd = datetime.now().strftime("%m/%d")
+        if not self._lo_scope:
+            # Common case: served from the rolling counters in O(1)
+            return self._today_sessions, self._today_messages
+
+        # LO scope needs per-project filtering — scan today's entries
+        today_mmdd, _, _, _ = self._current_date_sets()
+        live_entries = self._filter_entries_by_scope(self.tailer.entries_for_dates([today_mmdd]))
         sessions = 0
         messages = 0
         for entry in live_entries:
-            ts = entry.timestamp.strip()
-            if not re.match(r"\d{2}/\d{2}", ts) or not ts.startswith(today_mmdd):
-                continue
-            if "🟢" in entry.event and "Session started" in entry.event:
+            if entry.kind == _KIND_SESSION_START:
                 sessions += 1
-            if "🏁" in entry.event:
+            elif entry.kind == _KIND_FINISHED:
                 messages += 1
         return sessions, messages
 
@@ -1898,8 +2625,19 @@ class ClaudeDashboardApp(App):
         data = self._stats_cache
         if not data and not self.project_filter:
             return
-        self._update_stats_summary(data)
-        self._update_daily_tokens_table(data)
+        # Scoped views need a scan over the event log — do it exactly once
+        # and share the aggregate between the summary and the daily table.
+        agg: _StatsAgg | None = None
+        today_mmdd = self._current_date_sets()[0]
+        if self.project_filter:
+            entries = self._filter_entries_by_time(self.tailer.entries_for_project(self.project_filter))
+            agg = _aggregate_stats(entries, today_mmdd)
+        elif self._lo_scope:
+            entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
+            agg = _aggregate_stats(entries, today_mmdd)
+        with self.batch_update():
+            self._update_stats_summary(data, agg)
+            self._update_daily_tokens_table(data, agg)
 
     def _filter_daily_by_range(self, daily: list[dict]) -> list[dict]:
         """Filter daily data by the current time range selection."""
@@ -1910,67 +2648,24 @@ class ClaudeDashboardApp(App):
             return daily
         return [d for d in daily if d.get("date", "") in valid]
 
-    def _update_stats_summary(self, data: dict) -> None:
+    def _update_stats_summary(self, data: dict, agg: _StatsAgg | None = None) -> None:
         """Stats summary — respects time range filter and project filter."""
         rng = self._stats_time_range
         title_label = TIME_RANGE_LABELS.get(rng, rng)
 
-        if self.project_filter:
-            # Per-project: count sessions/messages from event log entries matching the project
-            entries = self._filter_entries_by_time(self.tailer.all_entries)
-            sessions = 0
-            messages = 0
-            dates_seen: set[str] = set()
-            for entry in entries:
-                if entry.project != self.project_filter:
-                    continue
-                if "🟢" in entry.event and "Session started" in entry.event:
-                    sessions += 1
-                if "🏁" in entry.event:
-                    messages += 1
-                m = re.match(r"(\d{2}/\d{2})", entry.timestamp.strip())
-                if m:
-                    dates_seen.add(m.group(1))
-            days_active = len(dates_seen)
-
+        # Scoped views (per-project or LO): render from the shared aggregate
+        if agg is not None and (self.project_filter or self._lo_scope):
+            label = self.project_filter or "LO Projects"
             box = Text()
-            box.append(f"  {self.project_filter} ({title_label})\n", style="bold #5fafff")
-            box.append(f"  {sessions:,} sessions", style="bold")
+            box.append(f"  {label} ({title_label})\n", style="bold #5fafff")
+            box.append(f"  {agg.sessions:,} sessions", style="bold")
             box.append("  |  ", style="dim")
-            box.append(f"{messages:,} messages", style="bold")
-            if days_active > 1:
+            box.append(f"{agg.messages:,} messages", style="bold")
+            if agg.days_active > 1:
                 box.append("  |  ", style="dim")
-                box.append(f"{days_active} days active", style="bold")
+                box.append(f"{agg.days_active} days active", style="bold")
             box.append("\n")
-            self.query_one("#stats-summary", Static).update(box)
-            return
-
-        # LO scope (no specific project): aggregate across LO projects
-        if self._lo_scope and not self.project_filter:
-            entries = self._filter_entries_by_scope(self._filter_entries_by_time(self.tailer.all_entries))
-            sessions = 0
-            messages = 0
-            dates_seen: set[str] = set()
-            for entry in entries:
-                if "🟢" in entry.event and "Session started" in entry.event:
-                    sessions += 1
-                if "🏁" in entry.event:
-                    messages += 1
-                m = re.match(r"(\d{2}/\d{2})", entry.timestamp.strip())
-                if m:
-                    dates_seen.add(m.group(1))
-            days_active = len(dates_seen)
-
-            box = Text()
-            box.append(f"  LO Projects ({title_label})\n", style="bold #5fafff")
-            box.append(f"  {sessions:,} sessions", style="bold")
-            box.append("  |  ", style="dim")
-            box.append(f"{messages:,} messages", style="bold")
-            if days_active > 1:
-                box.append("  |  ", style="dim")
-                box.append(f"{days_active} days active", style="bold")
-            box.append("\n")
-            self.query_one("#stats-summary", Static).update(box)
+            self._stats_summary.update(box)
             return
 
         daily = self._filter_daily_by_range(data.get("dailyActivity", []))
@@ -2025,21 +2720,17 @@ class ClaudeDashboardApp(App):
                     box.append("  |  ", style="dim")
                     box.append(f"Longest session: {longest_msgs} msgs", style="dim")
 
-        self.query_one("#stats-summary", Static).update(box)
+        self._stats_summary.update(box)
 
-    def _update_daily_tokens_table(self, data: dict) -> None:
+    def _update_daily_tokens_table(self, data: dict, agg: _StatsAgg | None = None) -> None:
         """Last 30 days of token usage per model."""
         # Per-project mode: use scanner data
         if self.project_filter:
             self._update_daily_tokens_table_project()
             return
 
-        daily_activity = data.get("dailyActivity", [])
-
-        # Build activity lookup for messages/sessions
-        activity_map: dict[str, dict] = {}
-        for d in daily_activity:
-            activity_map[d.get("date", "")] = d
+        # Activity lookup for messages/sessions — prebuilt at cache load
+        activity_map = self._activity_map
 
         # Filter by current time range
         rng = self._stats_time_range
@@ -2058,12 +2749,12 @@ class ClaudeDashboardApp(App):
             if self._is_cache_stale_for_today():
                 scanner_today = self._project_token_scanner.get_global_daily({today_str})
                 if scanner_today:
-                    # Replace or add today's entry with scanner data
-                    filtered = [d for d in filtered if d.get("date") != today_str]
-                    filtered.extend(scanner_today)
+                    # Replace or add today's entry with scanner data — today
+                    # sorts first, so prepend keeps the list newest-first
+                    filtered = scanner_today + [d for d in filtered if d.get("date") != today_str]
 
         if not filtered:
-            self.query_one("#stats-daily-tokens", Static).update(
+            self._stats_daily_tokens.update(
                 Text("  No daily token data available", style="dim")
             )
             return
@@ -2076,15 +2767,20 @@ class ClaudeDashboardApp(App):
 
         # Supplement live activity data for today
         if date_filter is None or today_str in date_filter:
-            live_sessions, live_messages = self._count_live_today_activity()
+            if agg is not None:
+                live_sessions, live_messages = agg.today_sessions, agg.today_messages
+            else:
+                live_sessions, live_messages = self._count_live_today_activity()
             if live_sessions > 0 or live_messages > 0:
-                act = activity_map.get(today_str, {})
+                # Overlay, don't mutate — the map is shared across refreshes
+                act = dict(activity_map.get(today_str, {}))
                 act["messageCount"] = act.get("messageCount", 0) + live_messages
                 act["sessionCount"] = act.get("sessionCount", 0) + live_sessions
                 act["date"] = today_str
-                activity_map[today_str] = act
+                activity_map = {**activity_map, today_str: act}
 
-        filtered.sort(key=lambda d: d.get("date", ""), reverse=True)
+        # Already newest-first: the scanner sorts its output and the cached
+        # dailyModelTokens list is sorted once at load
 
         scope_label = " — LO" if self._lo_scope else ""
         table = Table(
@@ -2101,44 +2797,51 @@ class ClaudeDashboardApp(App):
 
         display, total_days, total_pages = self._paginate_daily(filtered)
 
+        # Accumulate totals alongside the row pass instead of re-walking
+        # `display` once per column afterwards
+        model_sums = {mid: 0 for mid in model_list}
+        grand = 0
+        total_msgs = 0
+        total_sess = 0
+
+        add_row = table.add_row
         for day in display:
             date_str = day.get("date", "")
             tokens_by_model = day.get("tokensByModel", {})
 
-            row = [self._format_daily_date(date_str)]
+            row = [_format_daily_date(date_str)]
             day_total = 0
             for mid in model_list:
                 t = tokens_by_model.get(mid, 0)
                 day_total += t
+                model_sums[mid] += t
                 row.append(_format_tokens(t) if t > 0 else "—")
             row.append(_format_tokens(day_total))
+            grand += day_total
 
             # Add activity data
             act = activity_map.get(date_str, {})
             msgs = act.get("messageCount", 0)
             sess = act.get("sessionCount", 0)
+            total_msgs += msgs
+            total_sess += sess
             row.append(f"{msgs:,}" if msgs else "—")
             row.append(str(sess) if sess else "—")
 
-            table.add_row(*row)
+            add_row(*row)
 
         # Totals row (over displayed page)
         totals = ["[bold]Total[/]"]
-        grand = 0
         for mid in model_list:
-            model_sum = sum(d.get("tokensByModel", {}).get(mid, 0) for d in display)
-            grand += model_sum
-            totals.append(f"[bold]{_format_tokens(model_sum)}[/]")
+            totals.append(f"[bold]{_format_tokens(model_sums[mid])}[/]")
         totals.append(f"[bold]{_format_tokens(grand)}[/]")
-        total_msgs = sum(activity_map.get(d.get("date", ""), {}).get("messageCount", 0) for d in display)
-        total_sess = sum(activity_map.get(d.get("date", ""), {}).get("sessionCount", 0) for d in display)
         totals.append(f"[bold]{total_msgs:,}[/]")
         totals.append(f"[bold]{total_sess}[/]")
         table.add_row(*totals)
 
         # +4 columns: Date + models + Total + Msgs + Sessions
         self._add_page_hint(table, len(model_list) + 4, total_days, total_pages)
-        self.query_one("#stats-daily-tokens", Static).update(table)
+        self._stats_daily_tokens.update(table)
 
     def _paginate_daily(self, days: list[dict], page_size: int = 30) -> tuple[list[dict], int, int]:
         """Paginate a list of daily entries. Returns (page_slice, total_days, total_pages)."""
@@ -2158,14 +2861,6 @@ class ClaudeDashboardApp(App):
         table.add_row(*[""] * total_columns)
         table.add_row(hint, *[""] * (total_columns - 1))
 
-    def _format_daily_date(self, date_str: str) -> str:
-        """Format YYYY-MM-DD as 'Mon MM/DD'."""
-        try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.strftime("%a %m/%d")
-        except ValueError:
-            return date_str
-
     def _update_daily_tokens_table_project(self) -> None:
         """Daily token table for a single project using scanner data."""
         rng = self._stats_time_range
@@ -2174,7 +2869,7 @@ class ClaudeDashboardApp(App):
         daily = self._project_token_scanner.get_project_daily(self.project_filter, date_filter)
 
         if not daily:
-            self.query_one("#stats-daily-tokens", Static).update(
+            self._stats_daily_tokens.update(
                 Text(f"  No token data for {self.project_filter}", style="dim")
             )
             return
@@ -2197,28 +2892,30 @@ class ClaudeDashboardApp(App):
 
         display, total_days, total_pages = self._paginate_daily(daily)
 
+        model_sums = {mid: 0 for mid in model_list}
+        grand = 0
+        add_row = table.add_row
         for day in display:
             tokens_by_model = day.get("tokensByModel", {})
-            row = [self._format_daily_date(day.get("date", ""))]
+            row = [_format_daily_date(day.get("date", ""))]
             day_total = 0
             for mid in model_list:
                 t = tokens_by_model.get(mid, 0)
                 day_total += t
+                model_sums[mid] += t
                 row.append(_format_tokens(t) if t > 0 else "—")
             row.append(_format_tokens(day_total))
-            table.add_row(*row)
+            grand += day_total
+            add_row(*row)
 
         totals = ["[bold]Total[/]"]
-        grand = 0
         for mid in model_list:
-            model_sum = sum(d.get("tokensByModel", {}).get(mid, 0) for d in display)
-            grand += model_sum
-            totals.append(f"[bold]{_format_tokens(model_sum)}[/]")
+            totals.append(f"[bold]{_format_tokens(model_sums[mid])}[/]")
         totals.append(f"[bold]{_format_tokens(grand)}[/]")
         table.add_row(*totals)
 
         self._add_page_hint(table, len(model_list) + 2, total_days, total_pages)
-        self.query_one("#stats-daily-tokens", Static).update(table)
+        self._stats_daily_tokens.update(table)
 
     # ─── Actions ──────────────────────────────────────────────────────────
 
@@ -2243,7 +2940,7 @@ class ClaudeDashboardApp(App):
         self._update_sidebar()
         if self._is_stats_tab():
             self._refresh_stats_tab()
-        if self._active_tab == "tab-instances":
+        if self._is_instances_tab():
             self._refresh_instances_tab()
 
     def action_next_page(self) -> None:
@@ -2257,19 +2954,23 @@ class ClaudeDashboardApp(App):
         """Show/hide the filter input (Tab 1 only)."""
         if not self._is_live_tab():
             return
-        filter_input = self.query_one("#filter-input", Input)
+        filter_input = self._filter_input
         if filter_input.has_class("visible"):
             filter_input.remove_class("visible")
             filter_input.value = ""
-            self.text_filter = ""
-            self.query_one("#event-log", RichLog).focus()
+            if self.text_filter:
+                # Rebuild here: the Input.Changed that follows no-ops once
+                # the value already equals the (cleared) filter
+                self.text_filter = ""
+                self._rebuild_log()
+            self._event_log.focus()
         else:
             filter_input.add_class("visible")
             filter_input.focus()
 
     def action_cycle_project(self) -> None:
         """Cycle project filter: All → proj1 → proj2 → ... → All."""
-        if self._is_live_tab() and self.query_one("#filter-input", Input).has_focus:
+        if self._is_live_tab() and self._filter_input.has_focus:
             return
         projects = [p for p in self._projects if p in self._lo_projects] if self._lo_scope else self._projects
         if not projects:
@@ -2305,8 +3006,9 @@ class ClaudeDashboardApp(App):
 
     def action_clear_filters(self) -> None:
         """Clear all filters and close filter input."""
-        filter_input = self.query_one("#filter-input", Input)
-        filter_input.remove_class("visible")
+        filter_input = self._filter_input
+        if filter_input.has_class("visible"):
+            filter_input.remove_class("visible")
         filter_input.value = ""
         self.text_filter = ""
         self.project_filter = ""
@@ -2317,7 +3019,7 @@ class ClaudeDashboardApp(App):
         self._event_type_idx = 0
         if self._is_live_tab():
             self._rebuild_log()
-            self.query_one("#event-log", RichLog).focus()
+            self._event_log.focus()
         if self._is_stats_tab():
             self._refresh_stats_tab()
 
@@ -2325,59 +3027,85 @@ class ClaudeDashboardApp(App):
         """Check if a live-tab keyboard action should be ignored.
 
         Returns True when not on the Live tab or the filter input has focus.
+        Runs per keystroke while scrolling, hence the mask test.
         """
-        return not self._is_live_tab() or self.query_one("#filter-input", Input).has_focus
+        return not (self._active_tab_mask & _LIVE_TAB_MASK) or self._filter_input.has_focus
 
     def action_scroll_down(self) -> None:
         """Scroll log down, disable live tail (Tab 1 only)."""
         if self._should_ignore_live_action():
             return
-        self.live_tail = False
-        self.query_one("#event-log", RichLog).scroll_down(animate=False)
+        if self.live_tail:
+            self.live_tail = False
+        self._event_log.scroll_down(animate=False)
 
     def action_scroll_up(self) -> None:
         """Scroll log up, disable live tail (Tab 1 only)."""
         if self._should_ignore_live_action():
             return
-        self.live_tail = False
-        self.query_one("#event-log", RichLog).scroll_up(animate=False)
+        if self.live_tail:
+            self.live_tail = False
+        self._event_log.scroll_up(animate=False)
 
     def action_scroll_end(self) -> None:
         """Jump to bottom, resume live tail (Tab 1 only)."""
         if self._should_ignore_live_action():
             return
-        self.live_tail = True
-        self.query_one("#event-log", RichLog).scroll_end(animate=False)
+        if not self.live_tail:
+            self.live_tail = True
+        # Direct y-offset write: skips scroll_end's after-refresh deferral,
+        # which isn't needed here since no content was just written
+        log = self._event_log
+        log.scroll_to(y=log.max_scroll_y, animate=False, force=True, immediate=True)
 
     def action_scroll_home(self) -> None:
         """Jump to top (Tab 1 only)."""
         if self._should_ignore_live_action():
             return
-        self.live_tail = False
-        self.query_one("#event-log", RichLog).scroll_home(animate=False)
+        if self.live_tail:
+            self.live_tail = False
+        self._event_log.scroll_to(y=0, animate=False, force=True, immediate=True)
 
     # ─── Input events ─────────────────────────────────────────────────────
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Debounced filter on text input change."""
-        if event.input.id == "filter-input":
-            if self._filter_debounce_timer is not None:
-                self._filter_debounce_timer.stop()
+        """Throttled filter on text input change.
+
+        Leading + trailing edge: the first keystroke applies immediately so
+        results appear while typing, intermediate ones coalesce into a
+        single trailing apply.
+        """
+        if event.input.id != "filter-input":
+            return
+        now = time.monotonic()
+        if now - self._filter_last_apply >= 0.15:
+            self._filter_last_apply = now
+            self._apply_text_filter()
+        elif self._filter_debounce_timer is None:
             self._filter_debounce_timer = self.set_timer(
-                0.15, self._apply_text_filter
+                0.15, self._apply_text_filter_trailing
             )
 
+    def _apply_text_filter_trailing(self) -> None:
+        self._filter_debounce_timer = None
+        self._filter_last_apply = time.monotonic()
+        self._apply_text_filter()
+
     def _apply_text_filter(self) -> None:
         """Apply the text filter from the input widget."""
-        value = self.query_one("#filter-input", Input).value
+        value = self._filter_input.value
+        if value == self.text_filter:
+            return  # e.g. cursor movement fired Input.Changed — nothing to do
         self.text_filter = value
         self._rebuild_log()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """On Enter in filter input, close filter bar and keep filter active."""
         if event.input.id == "filter-input":
-            self.query_one("#filter-input", Input).remove_class("visible")
-            self.query_one("#event-log", RichLog).focus()
+            if self._filter_input.has_class("visible"):
+                self._filter_input.remove_class("visible")
+            if self.focused is not self._event_log:
+                self._event_log.focus()
 
 
 def main():